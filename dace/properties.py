@@ -406,8 +406,9 @@ def make_properties(cls):
                         "Property {} is unassigned in __init__ for {}".format(
                             name, cls.__name__))
         # Assert that there are no fields in the object not captured by
-        # properties, unless they are prefixed with "_"
-        for name, prop in obj.__dict__.items():
+        # properties, unless they are prefixed with "_". Objects that only
+        # use __slots__ have no instance dictionary to check.
+        for name, prop in getattr(obj, '__dict__', {}).items():
             if name not in properties and not name.startswith("_"):
                 raise PropertyError(
                     "{} : Variable {} is neither a Property nor "
@@ -1,26 +1,84 @@
 """ Contains classes implementing the different types of nodes of the stateful
     dataflow multigraph representation. """
 
-import ast
-from copy import deepcopy as dcpy
 import dace
+import functools
+import importlib
 import itertools
+import operator
+import sympy
+import sys
 import dace.serialize
 from typing import Any, Dict, Set
 from dace.config import Config
-from dace.sdfg import graph
-from dace.frontend.python.astutils import unparse
 from dace.properties import (
-    Property, CodeProperty, LambdaProperty, RangeProperty, DebugInfoProperty,
+    Property, CodeProperty, RangeProperty, DebugInfoProperty,
     SetProperty, make_properties, indirect_properties, DataProperty,
     SymbolicProperty, ListProperty, SDFGReferenceProperty, DictProperty,
     LibraryImplementationProperty, CodeBlock)
-from dace.frontend.operations import detect_reduction_type
+from dace.codegen.tools.type_inference import infer_expr_type
 from dace.symbolic import pystr_to_symbolic
 from dace import data, subsets as sbs, dtypes
 import pydoc
 import warnings
 
+
+def _intern_connector(connector_name):
+    """ Interns a connector name, so that the many set lookups performed on
+        connectors can compare names by identity. """
+    if type(connector_name) is str:
+        return sys.intern(connector_name)
+    return connector_name
+
+
+def _constant_int(expr):
+    """ Returns the value of an expression if it is a constant integer, or
+        None otherwise. """
+    if isinstance(expr, int):
+        return expr
+    if isinstance(expr, sympy.Integer):
+        return int(expr)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _constant_range_type(begin: int, end: int) -> dtypes.typeclass:
+    """ Returns the type of a map parameter whose range bounds are constant
+        integers. Such bounds recur across maps, and inferring their type
+        parses each bound as an expression, so the result is cached. """
+    return dtypes.result_type_of(infer_expr_type(begin), infer_expr_type(end))
+
+
+# Types that AccessNode.desc accepts in place of an SDFG, resolved lazily to
+# avoid an import loop
+_STATE_TYPES = None
+
+
+def _state_types():
+    global _STATE_TYPES
+    if _STATE_TYPES is None:
+        from dace.sdfg import SDFGState, ScopeSubgraphView
+        _STATE_TYPES = (SDFGState, ScopeSubgraphView)
+    return _STATE_TYPES
+
+
+@functools.lru_cache(maxsize=None)
+def _import_class(path: str):
+    module, _, name = path.rpartition('.')
+    return getattr(importlib.import_module(module), name)
+
+
+def _locate_class(path: str):
+    """ Returns the class at the given full class path, or None if it cannot
+        be found. Successful lookups are cached. """
+    try:
+        return _import_class(path)
+    except (ImportError, AttributeError, ValueError):
+        # Paths that do not point to a module attribute (e.g., nested
+        # classes) are resolved by pydoc
+        return pydoc.locate(path)
+
+
 # -----------------------------------------------------------------------------
 
 
@@ -28,19 +86,46 @@ import warnings
 class Node(object):
     """ Base node class. """
 
+    # Attributes prefixed with "_cuda" and "_cs" are set by the GPU code
+    # generator
+    __slots__ = ('_in_connectors', '_out_connectors', '_next_conn_cache',
+                 '_conn_union_cache', '_cuda_stream', '_cs_childpath')
+
+    # Type name used when serializing nodes of this class to JSON. Subclasses
+    # may override it by defining a "__jsontype__" class attribute.
+    _jsontype = 'Node'
+
     in_connectors = SetProperty(
         str, default=set(), desc="A set of input connectors for this node.")
     out_connectors = SetProperty(
         str, default=set(), desc="A set of output connectors for this node.")
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._jsontype = getattr(cls, '__jsontype__', cls.__name__)
+
     def __init__(self, in_connectors=None, out_connectors=None):
-        self.in_connectors = in_connectors or set()
-        self.out_connectors = out_connectors or set()
+        # Set the underlying connector sets directly, skipping the property
+        # validation. Names are converted to strings as the property does and
+        # interned as in add_in_connector/add_out_connector.
+        self._in_connectors = {
+            _intern_connector(str(c))
+            for c in in_connectors
+        } if in_connectors else set()
+        self._out_connectors = {
+            _intern_connector(str(c))
+            for c in out_connectors
+        } if out_connectors else set()
+        # Cached result of _next_connector_int, along with the connector sets
+        # it was computed from
+        self._next_conn_cache = None
+        # Cached union of input and output connectors (see all_connectors)
+        self._conn_union_cache = None
 
     def __str__(self):
-        if hasattr(self, 'label'):
+        try:
             return self.label
-        else:
+        except AttributeError:
             return type(self).__name__
 
     def validate(self, sdfg, state):
@@ -48,27 +133,29 @@ class Node(object):
 
     def to_json(self, parent):
         labelstr = str(self)
-        typestr = getattr(self, '__jsontype__', str(type(self).__name__))
+        typestr = self._jsontype
 
         try:
             scope_entry_node = parent.entry_node(self)
         except (RuntimeError, StopIteration):
             scope_entry_node = None
 
-        if scope_entry_node is not None:
-            ens = parent.exit_node(parent.entry_node(self))
-            scope_exit_node = str(parent.node_id(ens))
-            scope_entry_node = str(parent.node_id(scope_entry_node))
-        else:
-            scope_entry_node = None
-            scope_exit_node = None
-
-        # The scope exit of an entry node is the matching exit node
+        # NOTE: Node IDs and scope lookups are linear in the number of nodes
+        #       in the state, so each one is only computed once here.
         if isinstance(self, EntryNode):
+            # The scope exit of an entry node is the matching exit node
             try:
                 scope_exit_node = str(parent.node_id(parent.exit_node(self)))
             except (RuntimeError, StopIteration):
                 scope_exit_node = None
+        elif scope_entry_node is not None:
+            ens = parent.exit_node(scope_entry_node)
+            scope_exit_node = str(parent.node_id(ens))
+        else:
+            scope_exit_node = None
+
+        if scope_entry_node is not None:
+            scope_entry_node = str(parent.node_id(scope_entry_node))
 
         retdict = {
             "type": typestr,
@@ -81,7 +168,22 @@ class Node(object):
         return retdict
 
     def __repr__(self):
-        return type(self).__name__ + ' (' + self.__str__() + ')'
+        return '%s (%s)' % (type(self).__name__, self)
+
+    @property
+    def all_connectors(self):
+        """ Returns a frozen set of both the input and output connectors of
+            this node. """
+        in_conns = self._in_connectors
+        out_conns = self._out_connectors
+        cache = self._conn_union_cache
+        if (cache is None or cache[0] is not in_conns
+                or cache[1] is not out_conns or cache[2] != len(in_conns)
+                or cache[3] != len(out_conns)):
+            cache = (in_conns, out_conns, len(in_conns), len(out_conns),
+                     frozenset(in_conns).union(out_conns))
+            self._conn_union_cache = cache
+        return cache[4]
 
     def add_in_connector(self, connector_name: str):
         """ Adds a new input connector to the node. The operation will fail if
@@ -92,12 +194,13 @@ class Node(object):
             :return: True if the operation is successful, otherwise False.
         """
 
-        if (connector_name in self.in_connectors
-                or connector_name in self.out_connectors):
+        connector_name = _intern_connector(connector_name)
+        if (connector_name in self._in_connectors
+                or connector_name in self._out_connectors):
             return False
-        connectors = self.in_connectors
-        connectors.add(connector_name)
-        self.in_connectors = connectors
+        self._in_connectors.add(connector_name)
+        self._update_next_connector(connector_name)
+        self._conn_union_cache = None
         return True
 
     def add_out_connector(self, connector_name: str):
@@ -109,12 +212,13 @@ class Node(object):
             :return: True if the operation is successful, otherwise False.
         """
 
-        if (connector_name in self.in_connectors
-                or connector_name in self.out_connectors):
+        connector_name = _intern_connector(connector_name)
+        if (connector_name in self._in_connectors
+                or connector_name in self._out_connectors):
             return False
-        connectors = self.out_connectors
-        connectors.add(connector_name)
-        self.out_connectors = connectors
+        self._out_connectors.add(connector_name)
+        self._update_next_connector(connector_name)
+        self._conn_union_cache = None
         return True
 
     def remove_in_connector(self, connector_name: str):
@@ -123,10 +227,10 @@ class Node(object):
             :return: True if the operation was successful.
         """
 
-        if connector_name in self.in_connectors:
-            connectors = self.in_connectors
-            connectors.remove(connector_name)
-            self.in_connectors = connectors
+        if connector_name in self._in_connectors:
+            self._in_connectors.discard(connector_name)
+            self._next_conn_cache = None
+            self._conn_union_cache = None
         return True
 
     def remove_out_connector(self, connector_name: str):
@@ -135,29 +239,59 @@ class Node(object):
             :return: True if the operation was successful.
         """
 
-        if connector_name in self.out_connectors:
-            connectors = self.out_connectors
-            connectors.remove(connector_name)
-            self.out_connectors = connectors
+        if connector_name in self._out_connectors:
+            self._out_connectors.discard(connector_name)
+            self._next_conn_cache = None
+            self._conn_union_cache = None
         return True
 
+    def _update_next_connector(self, connector_name: str):
+        """ Updates the cached next connector ID after a connector was added
+            in-place to this node. """
+        cache = self._next_conn_cache
+        inconns, outconns = self._in_connectors, self._out_connectors
+        # The cache must be valid for the sets before the addition
+        if (cache is None or cache[0] is not inconns
+                or cache[1] is not outconns
+                or cache[2] + cache[3] + 1 != len(inconns) + len(outconns)):
+            self._next_conn_cache = None
+            return
+        next_number = cache[4]
+        if connector_name.startswith(('IN_', 'OUT_')):
+            cconn = connector_name[3 if connector_name[0] == 'I' else 4:]
+            if cconn.isdecimal():  # Skip non-integral connectors
+                curconn = int(cconn)
+                if curconn >= next_number:
+                    next_number = curconn + 1
+        self._next_conn_cache = (inconns, outconns, len(inconns),
+                                 len(outconns), next_number)
+
     def _next_connector_int(self) -> int:
         """ Returns the next unused connector ID (as an integer). Used for
             filling connectors when adding edges to scopes. """
+        # The cached value is only valid for the connector sets it was
+        # computed from. Setting a connector property (e.g., when
+        # deserializing) replaces the sets, and modifying the sets directly
+        # changes their sizes; both trigger a rescan.
+        cache = self._next_conn_cache
+        inconns, outconns = self._in_connectors, self._out_connectors
+        if (cache is not None and cache[0] is inconns
+                and cache[1] is outconns and cache[2] == len(inconns)
+                and cache[3] == len(outconns)):
+            return cache[4]
+
         next_number = 1
-        for conn in itertools.chain(self.in_connectors, self.out_connectors):
-            if conn.startswith('IN_'):
-                cconn = conn[3:]
-            elif conn.startswith('OUT_'):
-                cconn = conn[4:]
-            else:
-                continue
-            try:
-                curconn = int(cconn)
-                if curconn >= next_number:
-                    next_number = curconn + 1
-            except (TypeError, ValueError):  # not integral
-                continue
+        for connectors in (inconns, outconns):
+            for conn in connectors:
+                if not conn.startswith(('IN_', 'OUT_')):
+                    continue
+                cconn = conn[3 if conn[0] == 'I' else 4:]
+                if cconn.isdecimal():  # Skip non-integral connectors
+                    curconn = int(cconn)
+                    if curconn >= next_number:
+                        next_number = curconn + 1
+        self._next_conn_cache = (inconns, outconns, len(inconns),
+                                 len(outconns), next_number)
         return next_number
 
     def next_connector(self) -> str:
@@ -188,6 +322,8 @@ class Node(object):
 class AccessNode(Node):
     """ A node that accesses data in the SDFG. Denoted by a circular shape. """
 
+    __slots__ = ('_access', '_setzero', '_debuginfo', '_data')
+
     access = Property(
         choices=dtypes.AccessType,
         desc="Type of access to this array",
@@ -217,12 +353,16 @@ class AccessNode(Node):
 
     def __deepcopy__(self, memo):
         node = object.__new__(AccessNode)
+        memo[id(self)] = node
         node._access = self._access
         node._data = self._data
         node._setzero = self._setzero
-        node._in_connectors = self._in_connectors
-        node._out_connectors = self._out_connectors
-        node.debuginfo = dcpy(self.debuginfo)
+        node._in_connectors = set(self._in_connectors)
+        node._out_connectors = set(self._out_connectors)
+        node._next_conn_cache = None
+        node._conn_union_cache = None
+        # Debug information is never modified in-place, so it can be shared
+        node.debuginfo = self.debuginfo
         return node
 
     @property
@@ -233,8 +373,7 @@ class AccessNode(Node):
         return self.data
 
     def desc(self, sdfg):
-        from dace.sdfg import SDFGState, ScopeSubgraphView
-        if isinstance(sdfg, (SDFGState, ScopeSubgraphView)):
+        if isinstance(sdfg, _state_types()):
             sdfg = sdfg.parent
         return sdfg.arrays[self.data]
 
@@ -252,6 +391,8 @@ class CodeNode(Node):
         dependencies. May either be a tasklet or a nested SDFG, and
         denoted by an octagonal shape. """
 
+    __slots__ = ('_label', '_location', '_environments')
+
     label = Property(dtype=str, desc="Name of the CodeNode")
     location = DictProperty(
         key_type=str,
@@ -270,7 +411,11 @@ class CodeNode(Node):
 
     @property
     def free_symbols(self) -> Set[str]:
-        return set().union(*[v.free_symbols for v in self.location.values()])
+        if not self.location:
+            return set()
+        return set(
+            itertools.chain.from_iterable(v.free_symbols
+                                          for v in self.location.values()))
 
 
 @make_properties
@@ -282,6 +427,8 @@ class Tasklet(CodeNode):
         language by the code generator.
     """
 
+    __slots__ = ('_code', '_debuginfo', '_instrument')
+
     code = CodeProperty(desc="Tasklet code", default=CodeBlock(""))
     debuginfo = DebugInfoProperty()
 
@@ -329,8 +476,7 @@ class Tasklet(CodeNode):
 
     @property
     def free_symbols(self) -> Set[str]:
-        return self.code.get_free_symbols(self.in_connectors
-                                          | self.out_connectors)
+        return self.code.get_free_symbols(self.all_connectors)
 
     def __str__(self):
         if not self.label:
@@ -353,6 +499,9 @@ class NestedSDFG(CodeNode):
         @note: A nested SDFG cannot create recursion (one of its parent SDFGs).
     """
 
+    __slots__ = ('_sdfg', '_schedule', '_symbol_mapping', '_debuginfo',
+                 '_is_collapsed', '_instrument', '_free_symbols_cache')
+
     # NOTE: We cannot use SDFG as the type because of an import loop
     sdfg = SDFGReferenceProperty(desc="The SDFG", allow_none=True)
     schedule = Property(
@@ -394,6 +543,9 @@ class NestedSDFG(CodeNode):
         self.symbol_mapping = symbol_mapping or {}
         self.schedule = schedule
         self.debuginfo = debuginfo
+        # Cached free symbols, along with the symbol mapping and location
+        # contents they were computed from
+        self._free_symbols_cache = None
 
     @staticmethod
     def from_json(json_obj, context=None):
@@ -415,13 +567,24 @@ class NestedSDFG(CodeNode):
 
     @property
     def free_symbols(self) -> Set[str]:
-        return set().union(
-            *(map(str,
-                  pystr_to_symbolic(v).free_symbols)
-              for v in self.symbol_mapping.values()),
-            *(map(str,
-                  pystr_to_symbolic(v).free_symbols)
-              for v in self.location.values()))
+        if not self.symbol_mapping and not self.location:
+            return set()
+        # Both dictionaries may be modified in-place, so the cache is keyed by
+        # their contents rather than by identity
+        key = (tuple(self.symbol_mapping.items()),
+               tuple(self.location.items()))
+        cache = self._free_symbols_cache
+        if cache is None or cache[0] != key:
+            result = set(
+                map(
+                    str,
+                    itertools.chain.from_iterable(
+                        pystr_to_symbolic(v).free_symbols
+                        for v in itertools.chain(self.symbol_mapping.values(),
+                                                 self.location.values()))))
+            cache = (key, result)
+            self._free_symbols_cache = cache
+        return set(cache[1])
 
     def __str__(self):
         if not self.label:
@@ -438,19 +601,27 @@ class NestedSDFG(CodeNode):
         for out_conn in self.out_connectors:
             if not dtypes.validate_name(out_conn):
                 raise NameError('Invalid output connector "%s"' % out_conn)
-        connectors = self.in_connectors | self.out_connectors
+        connectors = self.all_connectors
+        transients = set()
+        non_transients = set()
         for dname, desc in self.sdfg.arrays.items():
             # TODO(later): Disallow scalars without access nodes (so that this
             #              check passes for them too).
             if isinstance(desc, data.Scalar):
                 continue
-            if not desc.transient and dname not in connectors:
-                raise NameError('Data descriptor "%s" not found in nested '
-                                'SDFG connectors' % dname)
-            if dname in connectors and desc.transient:
-                raise NameError(
-                    '"%s" is a connector but its corresponding array is transient'
-                    % dname)
+            if desc.transient:
+                transients.add(dname)
+            else:
+                non_transients.add(dname)
+        missing = non_transients - connectors
+        if missing:
+            raise NameError('Data descriptor "%s" not found in nested '
+                            'SDFG connectors' % min(missing))
+        illegal = connectors & transients
+        if illegal:
+            raise NameError(
+                '"%s" is a connector but its corresponding array is transient'
+                % min(illegal))
 
         # Validate undefined symbols
         symbols = set(k for k in self.sdfg.free_symbols if k not in connectors)
@@ -470,9 +641,52 @@ class NestedSDFG(CodeNode):
 class EntryNode(Node):
     """ A type of node that opens a scope (e.g., Map or Consume). """
 
+    __slots__ = ('_dyn_inputs_cache', )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Cached dynamic input connectors, along with the input connector set
+        # (and its size) they were computed from
+        self._dyn_inputs_cache = None
+
     def validate(self, sdfg, state):
         self.map.validate(sdfg, state, self)
 
+    def _valid_dyn_inputs_cache(self):
+        cache = self._dyn_inputs_cache
+        if (cache is None or cache[0] is not self._in_connectors
+                or cache[1] != len(self._in_connectors)):
+            return None
+        return cache
+
+    def _dynamic_inputs(self) -> Set[str]:
+        """ Returns the dynamic input connectors of this scope entry, i.e.,
+            input connectors that do not start with "IN_". """
+        cache = self._valid_dyn_inputs_cache()
+        if cache is None:
+            cache = (self._in_connectors, len(self._in_connectors),
+                     set(c for c in self._in_connectors
+                         if not c.startswith('IN_')))
+            self._dyn_inputs_cache = cache
+        return cache[2]
+
+    def add_in_connector(self, connector_name: str):
+        cache = self._valid_dyn_inputs_cache()
+        if not super().add_in_connector(connector_name):
+            return False
+        if cache is not None:
+            if not connector_name.startswith('IN_'):
+                cache[2].add(connector_name)
+            self._dyn_inputs_cache = (cache[0], cache[1] + 1, cache[2])
+        return True
+
+    def remove_in_connector(self, connector_name: str):
+        cache = self._valid_dyn_inputs_cache()
+        if cache is not None and connector_name in self._in_connectors:
+            cache[2].discard(connector_name)
+            self._dyn_inputs_cache = (cache[0], cache[1] - 1, cache[2])
+        return super().remove_in_connector(connector_name)
+
 
 # ------------------------------------------------------------------------------
 
@@ -481,6 +695,8 @@ class EntryNode(Node):
 class ExitNode(Node):
     """ A type of node that closes a scope (e.g., Map or Consume). """
 
+    __slots__ = ()
+
     def validate(self, sdfg, state):
         self.map.validate(sdfg, state, self)
 
@@ -494,11 +710,16 @@ class MapEntry(EntryNode):
         @see: Map
     """
 
+    __slots__ = ('_map', '_free_symbols_cache')
+
     def __init__(self, map: 'Map', dynamic_inputs=None):
         super(MapEntry, self).__init__(dynamic_inputs or set())
         if map is None:
             raise ValueError("Map for MapEntry can not be None.")
         self._map = map
+        # Cached free symbols of the map range, along with the range
+        # dimensions they were computed from
+        self._free_symbols_cache = None
 
     @staticmethod
     def map_type():
@@ -537,25 +758,36 @@ class MapEntry(EntryNode):
     def __str__(self):
         return str(self.map)
 
+    def _range_free_symbols(self) -> Set[str]:
+        """ Returns the free symbols of the map range. The result is cached
+            and recomputed only when the range dimensions change. """
+        key = tuple(self._map.range.ranges)
+        cache = self._free_symbols_cache
+        if cache is None or cache[0] != key:
+            cache = (key, self._map.range.free_symbols)
+            self._free_symbols_cache = cache
+        return cache[1]
+
     @property
     def free_symbols(self) -> Set[str]:
-        dyn_inputs = set(c for c in self.in_connectors
-                         if not c.startswith('IN_'))
-        return set(k for k in self._map.range.free_symbols
+        dyn_inputs = self._dynamic_inputs()
+        return set(k for k in self._range_free_symbols()
                    if k not in dyn_inputs)
 
     def new_symbols(self, sdfg, state, symbols) -> Dict[str, dtypes.typeclass]:
-        from dace.codegen.tools.type_inference import infer_expr_type
-
         result = {}
         # Add map params
         for p, rng in zip(self._map.params, self._map.range):
-            result[p] = dtypes.result_type_of(infer_expr_type(rng[0], symbols),
-                                              infer_expr_type(rng[1], symbols))
+            begin, end = _constant_int(rng[0]), _constant_int(rng[1])
+            if begin is not None and end is not None:
+                result[p] = _constant_range_type(begin, end)
+            else:
+                result[p] = dtypes.result_type_of(
+                    infer_expr_type(rng[0], symbols),
+                    infer_expr_type(rng[1], symbols))
 
         # Add dynamic inputs
-        dyn_inputs = set(c for c in self.in_connectors
-                         if not c.startswith('IN_'))
+        dyn_inputs = self._dynamic_inputs()
 
         # TODO: Get connector type from connector
         for e in state.in_edges(self):
@@ -571,6 +803,8 @@ class MapExit(ExitNode):
         @see: Map
     """
 
+    __slots__ = ('_map', )
+
     def __init__(self, map: 'Map'):
         super(MapExit, self).__init__()
         if map is None:
@@ -632,6 +866,11 @@ class Map(object):
         schedule property to generate appropriate code, e.g., GPU kernels.
     """
 
+    # "_can_be_supersection_start" is set by PAPI instrumentation
+    __slots__ = ('_label', '_params', '_range', '_schedule', '_unroll',
+                 '_collapse', '_debuginfo', '_is_collapsed', '_instrument',
+                 '_fence_instrumentation', '_can_be_supersection_start')
+
     # List of (editable) properties
     label = Property(dtype=str, desc="Label of the map")
     params = ListProperty(element_type=str, desc="Mapped parameters")
@@ -682,11 +921,9 @@ class Map(object):
         self._fence_instrumentation = fence_instrumentation
 
     def __str__(self):
-        return self.label + "[" + ", ".join([
-            "{}={}".format(i, r)
-            for i, r in zip(self._params,
-                            [sbs.Range.dim_to_string(d) for d in self._range])
-        ]) + "]"
+        return "%s[%s]" % (self.label, ", ".join(
+            "%s=%s" % (p, sbs.Range.dim_to_string(d))
+            for p, d in zip(self._params, self._range)))
 
     def validate(self, sdfg, state, node):
         if not dtypes.validate_name(self.label):
@@ -709,6 +946,8 @@ class ConsumeEntry(EntryNode):
         @see: Consume
     """
 
+    __slots__ = ('_consume', )
+
     def __init__(self, consume, dynamic_inputs=None):
         super(ConsumeEntry, self).__init__(dynamic_inputs or set())
         if consume is None:
@@ -756,23 +995,19 @@ class ConsumeEntry(EntryNode):
 
     @property
     def free_symbols(self) -> Set[str]:
-        dyn_inputs = set(c for c in self.in_connectors
-                         if not c.startswith('IN_'))
+        dyn_inputs = self._dynamic_inputs()
         return ((set(self._consume.num_pes.free_symbols)
                  | set(self._consume.condition.get_free_symbols())) -
                 dyn_inputs)
 
     def new_symbols(self, sdfg, state, symbols) -> Dict[str, dtypes.typeclass]:
-        from dace.codegen.tools.type_inference import infer_expr_type
-
         result = {}
         # Add PE index
         result[self._consume.pe_index] = infer_expr_type(
             self._consume.num_pes, symbols)
 
         # Add dynamic inputs
-        dyn_inputs = set(c for c in self.in_connectors
-                         if not c.startswith('IN_'))
+        dyn_inputs = self._dynamic_inputs()
 
         # TODO: Get connector type from connector
         for e in state.in_edges(self):
@@ -788,6 +1023,8 @@ class ConsumeExit(ExitNode):
         @see: Consume
     """
 
+    __slots__ = ('_consume', )
+
     def __init__(self, consume):
         super(ConsumeExit, self).__init__()
         if consume is None:
@@ -845,6 +1082,9 @@ class Consume(object):
         for processing, and they will try to pop elements from the input
         stream until a given quiescence condition is reached. """
 
+    __slots__ = ('_label', '_pe_index', '_num_pes', '_condition', '_schedule',
+                 '_chunksize', '_debuginfo', '_is_collapsed', '_instrument')
+
     # Properties
     label = Property(dtype=str, desc="Name of the consume node")
     pe_index = Property(dtype=str, desc="Processing element identifier")
@@ -921,6 +1161,8 @@ ConsumeEntry = indirect_properties(Consume,
 
 @dace.serialize.serializable
 class PipelineEntry(MapEntry):
+    __slots__ = ()
+
     @staticmethod
     def map_type():
         return Pipeline
@@ -951,6 +1193,8 @@ class PipelineEntry(MapEntry):
 
 @dace.serialize.serializable
 class PipelineExit(MapExit):
+    __slots__ = ()
+
     @staticmethod
     def map_type():
         return Pipeline
@@ -971,6 +1215,9 @@ class Pipeline(Map):
         initialization and drain phase (e.g., N*M + c iterations), which would
         otherwise need a flattened one-dimensional map.
     """
+    __slots__ = ('_init_size', '_init_overlap', '_drain_size',
+                 '_drain_overlap', '_loop_bound_cache')
+
     init_size = SymbolicProperty(
         default=0, desc="Number of initialization iterations.")
     init_overlap = Property(
@@ -996,21 +1243,32 @@ class Pipeline(Map):
         self.init_overlap = init_overlap
         self.drain_size = drain_size
         self.drain_overlap = drain_overlap
+        self._loop_bound_cache = None
 
     def iterator_str(self):
         return "__" + "".join(self.params)
 
     def loop_bound_str(self):
+        # The result is cached and recomputed only when the range or the
+        # init/drain phases change
+        key = (tuple(self.range.ranges), self.init_size, self.init_overlap,
+               self.drain_size, self.drain_overlap)
+        cache = self._loop_bound_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+
         from dace.codegen.targets.common import sym2cpp
-        bound = 1
-        for begin, end, step in self.range:
-            bound *= (step + end - begin) // step
+        bound = functools.reduce(operator.mul,
+                                 ((step + end - begin) // step
+                                  for begin, end, step in self.range), 1)
         # Add init and drain phases when relevant
         add_str = (" + " + sym2cpp(self.init_size)
                    if self.init_size != 0 and not self.init_overlap else "")
         add_str += (" + " + sym2cpp(self.drain_size)
                     if self.drain_size != 0 and not self.drain_overlap else "")
-        return sym2cpp(bound) + add_str
+        result = sym2cpp(bound) + add_str
+        self._loop_bound_cache = (key, result)
+        return result
 
     def init_condition(self):
         """Variable that can be checked to see if pipeline is currently in
@@ -1036,6 +1294,8 @@ PipelineEntry = indirect_properties(Pipeline,
 @make_properties
 class LibraryNode(CodeNode):
 
+    __slots__ = ('_name', '_implementation', '_schedule')
+
     name = Property(dtype=str, desc="Name of node")
     implementation = LibraryImplementationProperty(
         dtype=str,
@@ -1056,27 +1316,31 @@ class LibraryNode(CodeNode):
         self.label = name
 
     # Overrides subclasses to return LibraryNode as their JSON type
-    @property
-    def __jsontype__(self):
-        return 'LibraryNode'
+    __jsontype__ = 'LibraryNode'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Computed once per class, as it is needed for every serialization
+        cls._classpath = cls._fullclassname()
 
     # Based on https://stackoverflow.com/a/2020083/6489142
-    def _fullclassname(self):
-        module = self.__class__.__module__
+    @classmethod
+    def _fullclassname(cls):
+        module = cls.__module__
         if module is None or module == str.__class__.__module__:
-            return self.__class__.__name__  # Avoid reporting __builtin__
+            return cls.__name__  # Avoid reporting __builtin__
         else:
-            return module + '.' + self.__class__.__name__
+            return module + '.' + cls.__name__
 
     def to_json(self, parent):
         jsonobj = super().to_json(parent)
-        jsonobj['classpath'] = self._fullclassname()
+        jsonobj['classpath'] = self._classpath
         return jsonobj
 
     @classmethod
     def from_json(cls, json_obj, context=None):
         if cls == LibraryNode:
-            clazz = pydoc.locate(json_obj['classpath'])
+            clazz = _locate_class(json_obj['classpath'])
             if clazz is None:
                 raise TypeError('Unrecognized library node type "%s"' %
                                 json_obj['classpath'])
@@ -1099,20 +1363,20 @@ class LibraryNode(CodeNode):
             # Non-standard libraries are not defined in the config schema, and
             # thus might not exist in the config.
             config_implementation = None
+        config_override = False
         if config_implementation is not None:
             try:
                 config_override = Config.get("library", library_name,
                                              "override")
-                if config_override and implementation in self.implementations:
-                    if implementation is not None:
-                        warnings.warn(
-                            "Overriding explicitly specified "
-                            "implementation {} for {} with {}.".format(
-                                implementation, self.label,
-                                config_implementation))
-                    implementation = config_implementation
             except KeyError:
-                config_override = False
+                pass
+        if config_override and implementation in self.implementations:
+            if implementation is not None:
+                warnings.warn("Overriding explicitly specified "
+                              "implementation {} for {} with {}.".format(
+                                  implementation, self.label,
+                                  config_implementation))
+            implementation = config_implementation
         # If not explicitly set, try the node default
         if implementation is None:
             implementation = type(self).default_implementation
@@ -1135,7 +1399,8 @@ class LibraryNode(CodeNode):
         transformation_type = type(self).implementations[implementation]
         sdfg_id = sdfg.sdfg_list.index(sdfg)
         state_id = sdfg.nodes().index(state)
-        subgraph = {transformation_type._match_node: state.node_id(self)}
+        # Equivalent to state.node_id, without the Python-level scan
+        subgraph = {transformation_type._match_node: state.nodes().index(self)}
         transformation = transformation_type(sdfg_id, state_id, subgraph, 0)
         transformation.apply(sdfg, *args, **kwargs)
 
@@ -1150,3 +1415,6 @@ class LibraryNode(CodeNode):
                 "Transformation " + transformation_type.__name__ +
                 " is already registered with a different library node.")
         transformation_type._match_node = cls(match_node_name)
+
+
+LibraryNode._classpath = LibraryNode._fullclassname()
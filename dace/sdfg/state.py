@@ -677,10 +677,8 @@ class SDFGState(OrderedMultiDiConnectorGraph, StateGraphView):
     def remove_edge_and_connectors(self, edge):
         self._clear_scopedict_cache()
         super(SDFGState, self).remove_edge(edge)
-        if edge.src_conn in edge.src.out_connectors:
-            edge.src._out_connectors.remove(edge.src_conn)
-        if edge.dst_conn in edge.dst.in_connectors:
-            edge.dst._in_connectors.remove(edge.dst_conn)
+        edge.src.remove_out_connector(edge.src_conn)
+        edge.dst.remove_in_connector(edge.dst_conn)
 
     def to_json(self, parent=None):
         # Create scope dictionary with a failsafe
@@ -1306,7 +1304,7 @@ class SDFGState(OrderedMultiDiConnectorGraph, StateGraphView):
         if scope_connector is None:
             # Pick out numbered connectors that do not lead into the scope range
             conn_id = 1
-            for conn in scope_node.in_connectors | scope_node.out_connectors:
+            for conn in scope_node.all_connectors:
                 if conn.startswith("IN_") or conn.startswith("OUT_"):
                     conn_name = conn[conn.find("_") + 1:]
                     try:
@@ -1620,7 +1618,7 @@ class SDFGState(OrderedMultiDiConnectorGraph, StateGraphView):
                     if edge.dst_conn is not None or edge.data.data is None:
                         continue
                     edge._dst_conn = "IN_" + str(num_inputs + 1)
-                    node._in_connectors.add(edge.dst_conn)
+                    node.add_in_connector(edge.dst_conn)
                     conn_to_data[edge.data.data] = num_inputs + 1
 
                     num_inputs += 1
@@ -1632,7 +1630,7 @@ class SDFGState(OrderedMultiDiConnectorGraph, StateGraphView):
                     if edge.data.data is None:
                         continue
                     edge._src_conn = "OUT_" + str(conn_to_data[edge.data.data])
-                    node._out_connectors.add(edge.src_conn)
+                    node.add_out_connector(edge.src_conn)
             ####################################################
             # Same treatment for scope exits
             if isinstance(node, nd.ExitNode):
@@ -1654,7 +1652,7 @@ class SDFGState(OrderedMultiDiConnectorGraph, StateGraphView):
                     if edge.src_conn is not None or edge.data.data is None:
                         continue
                     edge._src_conn = "OUT_" + str(num_outputs + 1)
-                    node._out_connectors.add(edge.src_conn)
+                    node.add_out_connector(edge.src_conn)
                     conn_to_data[edge.data.data] = num_outputs + 1
 
                     num_outputs += 1
@@ -1666,7 +1664,7 @@ class SDFGState(OrderedMultiDiConnectorGraph, StateGraphView):
                     if edge.data.data is None:
                         continue
                     edge._dst_conn = "IN_" + str(conn_to_data[edge.data.data])
-                    node._in_connectors.add(edge.dst_conn)
+                    node.add_in_connector(edge.dst_conn)
 
 
 class StateSubgraphView(SubgraphView, StateGraphView):
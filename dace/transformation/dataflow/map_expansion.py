@@ -84,7 +84,7 @@ class MapExpansion(pm.Transformation):
         for edge in dynamic_edges:
             # Remove old edge and connector
             graph.remove_edge(edge)
-            edge.dst._in_connectors.remove(edge.dst_conn)
+            edge.dst.remove_in_connector(edge.dst_conn)
 
             # Propagate to each range it belongs to
             path = []
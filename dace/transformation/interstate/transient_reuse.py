@@ -2,6 +2,9 @@ from dace import registry, sdfg as sd
 from dace.sdfg import nodes
 from dace.transformation import pattern_matching
 from dace.properties import make_properties
+from dace.config import Config
+import collections
+import itertools
 import networkx as nx
 
 
@@ -29,108 +32,133 @@ class TransientReuse(pattern_matching.Transformation):
 
     def apply(self, sdfg):
 
-        memory_before = 0
-        arrays = {}
-        for a in sdfg.arrays:
-            if sdfg.arrays[a].transient:
-                arrays[a] = 0
-                memory_before += sdfg.arrays[a].total_size
+        debugprint = Config.get_bool("debugprint")
+        if debugprint:
+            # Sizes of all transients, including the ones added below
+            sizes = {
+                a: desc.total_size
+                for a, desc in sdfg.arrays.items() if desc.transient
+            }
+            memory_before = sum(sizes.values())
 
         # only consider transients appearing in one single state
-        for state in sdfg.states():
-            for a in state.all_transients():
-                arrays[a] += 1
-
-        transients = set()
-        for a in arrays:
-            if arrays[a] == 1:
-                transients.add(a)
+        counts = collections.Counter(
+            itertools.chain.from_iterable(s.all_transients()
+                                          for s in sdfg.states()))
+        transients = {
+            a
+            for a, desc in sdfg.arrays.items()
+            if desc.transient and counts[a] == 1
+        }
 
         for state in sdfg.nodes():
+            # Skip states without at least two transients to reuse
+            state_transients = transients & {
+                n.data
+                for n in state.nodes() if isinstance(n, nodes.AccessNode)
+            }
+            if len(state_transients) < 2:
+                continue
+
             # Copy the whole graph
             G = nx.MultiDiGraph()
-            for n in state.nodes():
-                G.add_node(n)
-            for n in state.nodes():
-                for e in state.all_edges(n):
-                    G.add_edge(e.src, e.dst)
+            G.add_nodes_from(state.nodes())
+            G.add_edges_from((e.src, e.dst) for e in state.edges())
 
             # Collapse all mappings and their scopes into one node
             scope_dict = state.scope_dict(node_to_children=True)
-            for n in scope_dict[None]:
-                if isinstance(n, nodes.EntryNode):
-                    G.add_edges_from([
-                        (n, x) for (y, x) in G.out_edges(state.exit_node(n))
-                    ])
-                    G.remove_nodes_from(scope_dict[n])
+            entry_to_exit = {
+                n: state.exit_node(n)
+                for n in scope_dict[None] if isinstance(n, nodes.EntryNode)
+            }
+            G.add_edges_from([(n, x)
+                              for n, exit_node in entry_to_exit.items()
+                              for x in G.successors(exit_node)])
+            G.remove_nodes_from(
+                itertools.chain.from_iterable(scope_dict[n]
+                                              for n in entry_to_exit))
 
             # Remove all nodes that are not AccessNodes or have incoming wcr edges
-            # and connect their predecessors and successors
+            # and connect their predecessors and successors. Removal is
+            # deferred, which keeps paths through several removed nodes since
+            # each of them is bridged in turn.
+            g_nodes = set(G)
+            removed = []
             for n in state.nodes():
-                if n in G.nodes():
-                    if not isinstance(n, nodes.AccessNode):
-                        for p in G.predecessors(n):
-                            for c in G.successors(n):
-                                G.add_edge(p, c)
-                        G.remove_node(n)
-                    else:
-                        for e in state.all_edges(n):
-                            if e.data.wcr is not None:
-                                for p in G.predecessors(n):
-                                    for s in G.successors(n):
-                                        G.add_edge(p, s)
-                                G.remove_node(n)
-                                break
-
-            # Setup the ancestors and successors arrays as well as the mappings dict
+                if n in g_nodes and (not isinstance(n, nodes.AccessNode)
+                                     or any(e.data.wcr is not None
+                                            for e in state.all_edges(n))):
+                    G.add_edges_from([(p, c) for p in G.predecessors(n)
+                                      for c in G.successors(n)])
+                    removed.append(n)
+            G.remove_nodes_from(removed)
+
+            # Setup the ancestors array as well as the mappings dict. Ancestor
+            # sets are accumulated in a single pass over a topological order.
+            topo = list(nx.topological_sort(G))
             ancestors = {}
-            successors = {}
-            for n in G.nodes():
-                successors[n] = set(G.successors(n))
-                ancestors[n] = set(nx.ancestors(G, n))
+            for n in topo:
+                anc = set()
+                for p in G.predecessors(n):
+                    anc |= ancestors[p]
+                    anc.add(p)
+                ancestors[n] = anc
             mappings = {}
-            for n in transients:
+            for n in state_transients:
                 mappings[n] = set()
 
+            # Transients accessed through more than one node cannot be reused
+            seen = set()
+            for n in topo:
+                if n.data in transients:
+                    if n.data in seen:
+                        transients.remove(n.data)
+                    seen.add(n.data)
+
+            # Group candidates by shape, type and storage, since only
+            # equivalent arrays in the same storage can be mapped onto each
+            # other
+            by_sig = {}
+            for n in topo:
+                if n.data in transients:
+                    desc = sdfg.arrays[n.data]
+                    sig = (tuple(desc.shape), desc.dtype, desc.storage)
+                    by_sig.setdefault(sig, []).append(n)
+
             # Find valid mappings. A mapping (n, m) is only valid if the successors of n
             # are a subset of the ancestors of m and n is also an ancestor of m.
             # Further the arrays have to be equivalent.
-            for n in G.nodes():
-                for m in G.nodes():
-                    if n is not m and n.data in transients and m.data in transients:
-                        if n.data == m.data:
-                            transients.remove(n.data)
-                        if (sdfg.arrays[n.data].is_equivalent(
-                                sdfg.arrays[m.data]) and n in ancestors[m]
-                                and successors[n].issubset(ancestors[m])):
+            for group in by_sig.values():
+                for i, n in enumerate(group):
+                    successors = set(G.successors(n))
+                    for m in group[i + 1:]:
+                        # m follows n in topological order
+                        if (n in ancestors[m]
+                                and successors.issubset(ancestors[m])
+                                and sdfg.arrays[n.data].is_equivalent(
+                                    sdfg.arrays[m.data])):
                             mappings[n.data].add(m.data)
 
-            # Find a final mapping, greedy coloring algorithm to find a mapping.
-            # Only add a transient to a bucket if either there is a mapping from it to
-            # all other elements of that bucket or there is a mapping from each element in the bucket to it.
+            # Find a final mapping by greedily coloring the conflict graph of
+            # each group, in which two transients are connected if neither can
+            # be mapped onto the other. Since valid mappings are transitive,
+            # the transients of one color can all share the same array.
             buckets = []
-            for i in range(len(transients)):
-                buckets.append([])
-
-            for n in transients:
-                for i in range(len(transients)):
-                    if not buckets[i]:
-                        buckets[i].append(n)
-                        break
-
-                    temp = True
-                    for j in range(len(buckets[i])):
-                        temp = (temp and n in mappings[buckets[i][j]])
-                    if temp:
-                        buckets[i].append(n)
-                        break
-
-                    temp2 = True
-                    for j in range(len(buckets[i])):
-                        temp2 = (temp2 and buckets[i][j] in mappings[n])
-                    if temp2:
-                        buckets[i].insert(0, n)
-                        break
+            for group in by_sig.values():
+                conflict = nx.Graph()
+                conflict.add_nodes_from(n.data for n in group)
+                for i, n in enumerate(group):
+                    for m in group[i + 1:]:
+                        if m.data not in mappings[n.data]:
+                            conflict.add_edge(n.data, m.data)
+                coloring = nx.coloring.greedy_color(conflict,
+                                                    strategy='largest_first')
+                # Groups are in topological order, which is kept in the buckets
+                group_buckets = collections.defaultdict(list)
+                for n in group:
+                    group_buckets[coloring[n.data]].append(n.data)
+                # Transients without a partner need no new array
+                buckets.extend(b for b in group_buckets.values() if len(b) > 1)
 
             # Build new custom transient to replace the other transients
             for i in range(len(buckets)):
@@ -139,41 +167,49 @@ class TransientReuse(pattern_matching.Transformation):
                     name = sdfg.add_datadesc("transient_reuse",
                                              array.clone(),
                                              find_new_name=True)
+                    if debugprint:
+                        sizes[name] = sizes[buckets[i][0]]
                     buckets[i].insert(0, name)
 
-            # Construct final mapping (transient_reuse_i, some_transient)
-            mapping = set()
+            # Construct final mapping (transient_reuse_i, some_transient).
+            # Transients appear in at most one bucket, so pairs are unique.
+            mapping = []
             for i in range(len(buckets)):
                 for j in range(1, len(buckets[i])):
-                    mapping.add((buckets[i][0], buckets[i][j]))
+                    mapping.append((buckets[i][0], buckets[i][j]))
 
             # For each mapping redirect edges and rename memlets in the state
-            for (new, old) in sorted(list(mapping)):
-                for n in state.nodes():
-                    if isinstance(n, nodes.AccessNode) and n.data == old:
-                        n.data = new
-                        for e in state.all_edges(n):
-                            for edge in state.memlet_tree(e):
-                                if edge.data.data == old:
-                                    edge.data.data = new
+            by_data = collections.defaultdict(list)
+            for n in state.nodes():
+                if isinstance(n, nodes.AccessNode):
+                    by_data[n.data].append(n)
+            for (new, old) in mapping:
+                visited = set()
+                for n in by_data[old]:
+                    n.data = new
+                    for e in state.all_edges(n):
+                        # Skip memlet trees that were already renamed
+                        if e in visited:
+                            continue
+                        for edge in state.memlet_tree(e):
+                            visited.add(edge)
+                            if edge.data.data == old:
+                                edge.data.data = new
 
         # clean up the arrays
-        for a in list(sdfg.arrays):
-            used = False
-            for s in sdfg.states():
-                for n in s.nodes():
-                    if isinstance(n, nodes.AccessNode) and n.data == a:
-                        used = True
-                        break
-            if not used:
-                sdfg.remove_data(a)
+        used = {
+            n.data
+            for s in sdfg.states() for n in s.nodes()
+            if isinstance(n, nodes.AccessNode)
+        }
+        freed = [a for a in sdfg.arrays if a not in used]
+        for a in freed:
+            sdfg.remove_data(a)
 
         # Analyze memory savings and output them
-        memory_after = 0
-        for a in sdfg.arrays:
-            if sdfg.arrays[a].transient:
-                memory_after += sdfg.arrays[a].total_size
-
-        print('memory before: ', memory_before, 'B')
-        print('memory after: ', memory_after, 'B')
-        print('memory savings: ', memory_before - memory_after, 'B')
+        if debugprint:
+            memory_after = (sum(sizes.values()) -
+                            sum(sizes.get(a, 0) for a in freed))
+            print('memory before: ', memory_before, 'B')
+            print('memory after: ', memory_after, 'B')
+            print('memory savings: ', memory_before - memory_after, 'B')
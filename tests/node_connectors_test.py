@@ -0,0 +1,83 @@
+import sys
+import dace
+from dace.sdfg import nodes
+
+
+def _make_map_entry():
+    m = nodes.Map('m', ['i'], dace.subsets.Range([(0, 9, 1)]))
+    return nodes.MapEntry(m)
+
+
+def test_next_connector_add():
+    me = _make_map_entry()
+    assert me.next_connector() == '1'
+    me.add_in_connector('IN_' + me.next_connector())
+    me.add_out_connector('OUT_' + me.last_connector())
+    assert me.next_connector() == '2'
+    assert me.last_connector() == '1'
+    me.add_in_connector('IN_5')
+    assert me.next_connector() == '6'
+    me.add_in_connector('dyn')
+    me.add_out_connector('OUT_x')
+    assert me.next_connector() == '6'
+
+
+def test_next_connector_property():
+    me = _make_map_entry()
+    me.add_in_connector('IN_3')
+    assert me.next_connector() == '4'
+    me.in_connectors = {'IN_7'}
+    assert me.next_connector() == '8'
+    me.remove_in_connector('IN_7')
+    assert me.next_connector() == '1'
+
+
+def test_next_connector_direct_mutation():
+    me = _make_map_entry()
+    assert me.next_connector() == '1'
+    me._in_connectors.add('IN_1')
+    assert me.next_connector() == '2'
+    me.add_out_connector('OUT_2')
+    assert me.next_connector() == '3'
+
+
+def test_dynamic_inputs():
+    me = _make_map_entry()
+    me.map.range = dace.subsets.Range([(0, dace.symbol('N') - 1, 1)])
+    assert me.free_symbols == {'N'}
+    me.add_in_connector('IN_1')
+    me.add_in_connector('N')
+    assert me.free_symbols == set()
+    me.remove_in_connector('N')
+    assert me.free_symbols == {'N'}
+    me.in_connectors = {'IN_1', 'N'}
+    assert me.free_symbols == set()
+
+
+def test_all_connectors():
+    t = nodes.Tasklet('t', {'a'}, {'b'}, 'b = a')
+    assert t.all_connectors == {'a', 'b'}
+    t.add_in_connector('c')
+    assert t.all_connectors == {'a', 'b', 'c'}
+    t.remove_out_connector('b')
+    assert t.all_connectors == {'a', 'c'}
+    t.out_connectors = {'d'}
+    assert t.all_connectors == {'a', 'c', 'd'}
+
+
+def test_initial_connectors():
+    name = ''.join(['IN_', '4'])
+    t = nodes.Tasklet('t', {name}, {'b'}, 'b = 1')
+    assert next(iter(t.in_connectors)) is sys.intern(name)
+    me = nodes.Node({1, 'IN_2'})
+    assert me.in_connectors == {'1', 'IN_2'}
+    assert me.next_connector() == '3'
+
+
+if __name__ == '__main__':
+    test_next_connector_add()
+    test_next_connector_property()
+    test_next_connector_direct_mutation()
+    test_dynamic_inputs()
+    test_all_connectors()
+    test_initial_connectors()
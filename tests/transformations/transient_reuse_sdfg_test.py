@@ -0,0 +1,71 @@
+import dace
+from dace.transformation.interstate.transient_reuse import TransientReuse
+
+
+def _build_chain(names, storage=None):
+    """ Builds a single-state SDFG that copies data along the given chain of
+        arrays. Names starting with 't' are transients, and the same name may
+        appear multiple times to create multiple access nodes. """
+    storage = storage or {}
+    sdfg = dace.SDFG('transient_reuse_chain')
+    for name in set(names):
+        if name.startswith('t'):
+            sdfg.add_transient(name, [20],
+                               dace.float64,
+                               storage=storage.get(
+                                   name, dace.StorageType.Default))
+        else:
+            sdfg.add_array(name, [20], dace.float64)
+    state = sdfg.add_state()
+    prev = state.add_access(names[0])
+    for i, (src, dst) in enumerate(zip(names, names[1:])):
+        node = state.add_access(dst)
+        state.add_mapped_tasklet('copy%d' % i,
+                                 dict(i='0:20'),
+                                 dict(inp=dace.Memlet.simple(src, 'i')),
+                                 'out = inp',
+                                 dict(out=dace.Memlet.simple(dst, 'i')),
+                                 input_nodes={src: prev},
+                                 output_nodes={dst: node},
+                                 external_edges=True)
+        prev = node
+    return sdfg
+
+
+def _transients(sdfg):
+    return sorted(name for name, desc in sdfg.arrays.items()
+                  if desc.transient)
+
+
+def test_chain():
+    sdfg = _build_chain(['A', 't1', 'X', 't2', 'Y', 't3', 'B'])
+    sdfg.apply_transformations(TransientReuse)
+    sdfg.validate()
+    assert _transients(sdfg) == ['transient_reuse']
+
+
+def test_different_storage():
+    sdfg = _build_chain(['A', 't1', 'X', 't2', 'Y', 't3', 'B'],
+                        storage={'t2': dace.StorageType.CPU_ThreadLocal})
+    sdfg.apply_transformations(TransientReuse)
+    sdfg.validate()
+    assert _transients(sdfg) == ['t2', 'transient_reuse']
+    assert sdfg.arrays['t2'].storage == dace.StorageType.CPU_ThreadLocal
+    assert (sdfg.arrays['transient_reuse'].storage ==
+            dace.StorageType.Default)
+
+
+def test_multiple_access_nodes():
+    sdfg = _build_chain(['A', 't1', 'X', 't2', 'Y', 't2', 'Z', 't3', 'B'])
+    sdfg.apply_transformations(TransientReuse)
+    sdfg.validate()
+    assert 't2' in _transients(sdfg)
+    assert len([
+        n for n in sdfg.nodes()[0].data_nodes() if n.data == 't2'
+    ]) == 2
+
+
+if __name__ == '__main__':
+    test_chain()
+    test_different_storage()
+    test_multiple_access_nodes()